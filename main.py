@@ -1,8 +1,14 @@
 import os
+import re
 import json
+import heapq
+import signal
+import random
+import asyncio
 import discord
+from collections import Counter
 from discord.ext import commands, tasks
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 # ─── Discord Intents ──────────────────────────────────────────────────────────
 # Defines which Discord events the bot is allowed to receive.
@@ -13,6 +19,9 @@ intents.message_content = True
 intents.reactions = True
 intents.members = True
 intents.voice_states = True   # Required for the bot to join/leave voice channels
+intents.guild_scheduled_events = True   # Keeps guild.scheduled_events current, so commands can skip fetching them
+intents.presences = False   # Never read; presence updates are the bulk of gateway traffic on big servers
+intents.typing = False      # Typing indicators are never handled
 
 
 # ─── Channel & Role IDs ───────────────────────────────────────────────────────
@@ -29,6 +38,9 @@ EVENT_CHANNEL_ID       = 1467091170176929968   # Meeting Point voice channel (li
 GAME_LINKS_ID          = 1466911935395266641   # Game-links channel (winner messages tracked here)
 LEADERBOARD_CHANNEL_ID = 1466915479661842725   # Channel where the leaderboard embed is posted
 
+CHECK_EMOJI            = "✅"                   # Registration reaction on event posts
+MENTION_TEXT           = " ".join(f"<@&{r}>" for r in MENTION_ROLES)  # Ping line for MENTION_ROLES, built once
+
 
 # ─── File Paths ───────────────────────────────────────────────────────────────
 # JSON files used for persistent storage between bot restarts.
@@ -38,23 +50,100 @@ ALLOWED_ROLES    = [1466913409340543027, 1466913296597909682]  # Staff, Host –
 IDS_FILE         = "message_ids.json"   # Maps event ID → registration message ID
 LEADERBOARD_FILE = "leaderboard.json"   # Maps user ID → win count (legacy, kept for leaderboard cmd)
 STATS_FILE       = "stats.json"         # Maps user ID → full stats dict
+REACTIONS_FILE   = "reactions.json"     # Maps registration message ID → user IDs with ✅ (speeds up startup)
+STATE_FILE       = "state.json"         # Small bot bookkeeping values (e.g. the last leaderboard message ID)
+
+
+# ─── Tuning ───────────────────────────────────────────────────────────────────
+# Limits for how hard the bot pushes the Discord API.
+
+ROLE_EDIT_CONCURRENCY = 5     # Max role edits in flight at once (discord.py still enforces per-route limits)
+RETRY_ATTEMPTS        = 8     # Max tries for an API call that keeps getting rate limited (429)
+RETRY_BASE_DELAY      = 1.0   # First backoff delay in seconds, doubled after every retry
+RETRY_MAX_DELAY       = 60.0  # Upper bound for a single backoff delay in seconds
+REACTION_DEBOUNCE     = 3.0   # Seconds to wait after a ✅ removal before deciding to drop the role
+FLUSH_INTERVAL        = 2     # Seconds between writes of changed JSON files to disk
+WARNED_TTL            = 3600  # Seconds after an event's start time to keep remembering its 30-minute warning
+ROLE_QUEUE_RATE       = 15    # Max queued registration-role changes applied per second
+VC_RECONCILE_INTERVAL = 300   # Seconds between full VC role passes while a scrim runs (moves are handled live)
+REACTION_SCAN_LIMIT   = 500   # Max register-channel messages prime_reactions walks before fetching the rest one by one
+LEADERBOARD_SIZE      = 25    # Players shown in the leaderboard embed (keeps it well under the 4096-char description limit)
+API_RATE              = 40    # Max API calls started per second through with_backoff (Discord's global limit is 50/s)
+
+
+# ─── Input Patterns ───────────────────────────────────────────────────────────
+# Precompiled regexes for parsing command arguments and game-links posts.
+
+# r!create arguments: "Title, Description, <t:1700000000:R>" in one pass. The description may contain
+# commas (it runs to the last comma); the timestamp may be <t:1700000000:R>, <t:1700000000> or a bare 1700000000
+# (group 3 holds the <t:…> form, group 4 the bare integer)
+CREATE_RE = re.compile(r"^\s*([^,]*?)\s*,\s*(.*?)\s*,\s*(?:<t:(\d+)(?::[tTdDfFR])?>|(\d+))\s*$", re.S)
+
+# "winner" anywhere in a game-links post, any case – searched without lowercasing a copy of the message
+WINNER_RE = re.compile(r"winner", re.IGNORECASE)
 
 
 # ─── Runtime State ────────────────────────────────────────────────────────────
 # In-memory variables that track the current session.
 # These reset on bot restart – they do NOT persist to disk.
 
-warned_events            = set()   # Event IDs that already received the 30-minute warning
-scrim_active             = False   # True once r!event update is used; activates the auto VC check loop
+scrim_active             = False   # True once r!event update is used; activates live VC role tracking
+last_vc_reconcile        = None    # Time of the last full VC role pass in check_events
+last_vc_snapshot         = None    # (Meeting Point IDs, game VC IDs) seen by the last update_scrim_vc_roles pass
 manually_deleting        = False   # True while r!delete event is running; prevents auto event restart
 current_game_participants = set()  # User IDs who had Active Scrim role since the last r!event update
                                    # Everyone in this set counts as "has played" when a game is logged
+pending_role_removals    = {}      # User ID → task that re-checks their registration role after a ✅ removal
+background_tasks         = set()   # Fire-and-forget tasks, referenced here so they aren't garbage collected
+role_queue               = asyncio.Queue()  # (member, role, add?) changes from reaction events, applied by role_worker
+role_worker_task         = None    # The running role_worker task (started once in on_ready)
+api_tokens               = API_RATE  # Token bucket for throttle(): calls that may start right now
+api_tokens_at            = 0.0       # Event-loop time the bucket was last refilled
+registration_holders     = set()   # IDs of members with the registration role; seeded on connect, kept live by member events
+
+
+# ─── Cached Storage ───────────────────────────────────────────────────────────
+# In-memory mirrors of the JSON files, filled once in on_ready.
+# Event handlers read these instead of re-reading the files on every Discord event.
+# track_event() / untrack_*() keep both mirrors in sync and mark the file dirty;
+# the flush_state loop writes dirty files every FLUSH_INTERVAL seconds (and once on shutdown).
+
+tracked_events       = {}     # Mirror of message_ids.json → {event_id: message_id}
+event_by_message     = {}     # Reverse index of tracked_events → {message_id: event_id}; its keys are the tracked message IDs
+reactions_by_message = {}     # {message_id: set of user IDs who reacted ✅}, kept live by the reaction events
+reaction_counts      = Counter()  # {user_id: number of tracked messages they reacted ✅ on}; only change via *_reactor(s)
+live_reactions       = {}     # {message_id: bots among its ✅ reactors} for reactor sets paged (or created) during this
+                              # gateway session and kept live by the events since; only these are trusted without paging
+leaderboard_cache    = {}     # Mirror of leaderboard.json → {user_id (int): win_count}
+stats_cache          = {}     # Mirror of stats.json → {user_id (int): stats_dict}
+bot_state            = {}     # Mirror of state.json → {"leaderboard_message_id": int, "leaderboard_cursor": int, "warned_events": ...}
+warned_events        = {}     # {event_id (int): start timestamp} of events whose 30-minute warning was sent;
+                              # stored as bot_state["warned_events"], so a restart never repeats a warning
+dirty_files          = set()  # JSON files whose in-memory mirror changed since the last flush
+state_loaded         = False  # True once the mirrors were read from disk (later on_ready calls keep them)
+
+
+# ─── Resolved Discord Objects ─────────────────────────────────────────────────
+# Channel / guild / role objects looked up once in on_ready (and again after a resume)
+# so hot event handlers don't repeat the same cache lookups on every event.
+
+scrim_guild         = None   # Guild that owns the registration channel
+register_channel    = None   # Registration channel (CHANNEL_ID)
+scrim_channel       = None   # Scrim chat channel (SCRIM_CHAT_ID)
+game_links_channel  = None   # Game links channel (GAME_LINKS_ID)
+leaderboard_channel = None   # Leaderboard channel (LEADERBOARD_CHANNEL_ID)
+event_channel       = None   # Meeting Point voice channel (EVENT_CHANNEL_ID)
+registration_role   = None   # Scrim registration role (ROLE_ID)
+active_role         = None   # Active Scrim role (ACTIVE_ROLE_ID)
+spectator_role      = None   # Spectator Scrim role (SPECTATOR_ROLE_ID)
+scrim_news_role     = None   # Scrim news role pinged with the leaderboard (MENTION_ROLES[1])
 
 
 # ─── Bot Initialization ───────────────────────────────────────────────────────
 # Creates the bot instance with the command prefix "r!" and the intents above.
 
-bot = commands.Bot(command_prefix="r!", intents=intents)
+# max_messages=None: no message cache – every handler uses raw events or the Message it is given
+bot = commands.Bot(command_prefix="r!", intents=intents, max_messages=None)
 
 
 # ─── Permission Check ─────────────────────────────────────────────────────────
@@ -84,46 +173,191 @@ def load_data() -> dict:
     return {}
 
 
-def save_data(data: dict):
-    """Write the given dict to message_ids.json."""
-    with open(IDS_FILE, "w") as f:
-        json.dump(data, f)
+def write_json_text(path: str, text: str):
+    """
+    Write already-serialised JSON text to the given file (run via asyncio.to_thread).
+    Writes to a temp file first and swaps it in, so a crash mid-write never leaves a truncated file.
+    The fsync makes sure the data is on disk before the rename, so a power loss can't swap in an empty file.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_tracked_events(data: dict):
+    """Fill tracked_events / event_by_message from the loaded message_ids.json (called on startup)."""
+    tracked_events.clear()
+    tracked_events.update(data)
+    event_by_message.clear()
+    event_by_message.update({msg_id: event_id for event_id, msg_id in tracked_events.items()})
+
+
+def track_event(event_id, message_id: int):
+    """Link an event to its registration message. Only marks the file dirty if the mapping changed."""
+    key = str(event_id)
+    if tracked_events.get(key) == message_id:
+        return
+    old_msg_id = tracked_events.get(key)
+    if old_msg_id is not None:
+        event_by_message.pop(old_msg_id, None)
+    tracked_events[key] = message_id
+    event_by_message[message_id] = key
+    dirty_files.add(IDS_FILE)
+
+
+def drop_reactors(msg_id: int) -> bool:
+    """Forget a message's cached ✅ reactors (and their reaction_counts). False if none were cached."""
+    live_reactions.pop(msg_id, None)
+    users = reactions_by_message.pop(msg_id, None)
+    if users is None:
+        return False
+    reaction_counts.subtract(users)
+    for user_id in users:
+        if reaction_counts[user_id] <= 0:
+            del reaction_counts[user_id]
+    return True
+
+
+def set_reactors(msg_id: int, users: set):
+    """Replace a message's cached ✅ reactor set, keeping reaction_counts in step."""
+    drop_reactors(msg_id)
+    reactions_by_message[msg_id] = users
+    reaction_counts.update(users)
+
+
+def add_reactor(msg_id: int, user_id: int):
+    """Record one ✅ reaction in the cache (no-op if it was already known)."""
+    users = reactions_by_message.setdefault(msg_id, set())
+    if user_id not in users:
+        users.add(user_id)
+        reaction_counts[user_id] += 1
+
+
+def remove_reactor(msg_id: int, user_id: int):
+    """Drop one ✅ reaction from the cache (no-op if it wasn't known)."""
+    users = reactions_by_message.get(msg_id)
+    if users is None or user_id not in users:
+        return
+    users.discard(user_id)
+    reaction_counts[user_id] -= 1
+    if reaction_counts[user_id] <= 0:
+        del reaction_counts[user_id]
+
+
+def untrack_event(event_id):
+    """Stop tracking an event. Returns its registration message ID, or None if it wasn't tracked."""
+    msg_id = tracked_events.pop(str(event_id), None)
+    if msg_id is None:
+        return None
+    event_by_message.pop(msg_id, None)
+    drop_reactors(msg_id)
+    dirty_files.update((IDS_FILE, REACTIONS_FILE))
+    return msg_id
+
+
+def untrack_messages(message_ids) -> list:
+    """Stop tracking every event linked to one of the given message IDs (O(1) per ID via event_by_message)."""
+    removed = []
+    for msg_id in set(message_ids):
+        event_id = event_by_message.pop(msg_id, None)
+        if event_id is None:
+            continue
+        tracked_events.pop(event_id, None)
+        drop_reactors(msg_id)
+        removed.append(event_id)
+    if removed:
+        dirty_files.update((IDS_FILE, REACTIONS_FILE))
+    return removed
+
+
+def load_reactions() -> dict:
+    """Load reactions.json → {message_id: set of user_ids}. Returns {} if file doesn't exist."""
+    if os.path.exists(REACTIONS_FILE):
+        with open(REACTIONS_FILE, "r") as f:
+            return {int(msg_id): set(user_ids) for msg_id, user_ids in json.load(f).items()}
+    return {}
+
+
+# Compact output, and no circular-reference bookkeeping (the mirrors are plain trees of dicts/lists)
+json_encoder = json.JSONEncoder(separators=(",", ":"), check_circular=False)
 
 
-def get_all_message_ids(data: dict) -> set:
-    """Extract just the message IDs (values) from the data dict as a set."""
-    return set(data.values())
+def dump_mirror(path: str) -> str:
+    """Serialise the in-memory mirror of the given JSON file."""
+    if path == IDS_FILE:
+        return json_encoder.encode(tracked_events)
+    if path == REACTIONS_FILE:
+        return json_encoder.encode({str(msg_id): sorted(users) for msg_id, users in reactions_by_message.items()})
+    if path == LEADERBOARD_FILE:
+        return json_encoder.encode(leaderboard_cache)   # int keys are written as JSON strings
+    if path == STATS_FILE:
+        return json_encoder.encode(stats_cache)   # int keys are written as JSON strings
+    if path == STATE_FILE:
+        return json_encoder.encode(bot_state)
+    raise ValueError(f"No in-memory mirror for {path}")
+
+
+def take_dirty_snapshots() -> list:
+    """
+    Serialise every dirty mirror and clear its dirty flag. Returns [(path, json_text)].
+    Serialising happens here on the event loop, so the file write itself can safely run in a
+    worker thread while handlers keep mutating the mirrors.
+    """
+    snapshots = [(path, dump_mirror(path)) for path in dirty_files]
+    dirty_files.clear()
+    return snapshots
+
+
+def write_snapshots(snapshots: list) -> list:
+    """Write every (path, json_text) snapshot. Returns [(path, error)] for the files that failed."""
+    failed = []
+    for path, text in snapshots:
+        try:
+            write_json_text(path, text)
+        except Exception as e:
+            failed.append((path, e))
+    return failed
+
+
+def flush_dirty_files():
+    """Synchronously write every dirty JSON file (used on shutdown, when the loop is gone)."""
+    for path, e in write_snapshots(take_dirty_snapshots()):
+        print(f"Error writing {path}: {e}")
 
 
 def load_leaderboard() -> dict:
-    """Load leaderboard.json → {user_id: win_count}. Returns {} if file doesn't exist."""
+    """Load leaderboard.json → {user_id (int): win_count}. Returns {} if file doesn't exist."""
     if os.path.exists(LEADERBOARD_FILE):
         with open(LEADERBOARD_FILE, "r") as f:
-            return json.load(f)
+            return {int(user_id): wins for user_id, wins in json.load(f).items()}
     return {}
 
 
-def save_leaderboard(data: dict):
-    """Write the given dict to leaderboard.json."""
-    with open(LEADERBOARD_FILE, "w") as f:
-        json.dump(data, f)
-
-
 def load_stats() -> dict:
-    """Load stats.json → {user_id: stats_dict}. Returns {} if file doesn't exist."""
+    """Load stats.json → {user_id (int): stats_dict}. Returns {} if file doesn't exist."""
     if os.path.exists(STATS_FILE):
         with open(STATS_FILE, "r") as f:
+            return {int(user_id): user_stats for user_id, user_stats in json.load(f).items()}
+    return {}
+
+
+def load_bot_state() -> dict:
+    """Load state.json → {key: value}. Returns {} if file doesn't exist."""
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, "r") as f:
             return json.load(f)
     return {}
 
 
-def save_stats(data: dict):
-    """Write the given dict to stats.json."""
-    with open(STATS_FILE, "w") as f:
-        json.dump(data, f)
+def load_state_files() -> tuple:
+    """Read every JSON state file in one go (run via asyncio.to_thread, so the event loop never blocks on disk)."""
+    return load_data(), load_leaderboard(), load_stats(), load_reactions(), load_bot_state()
 
 
-def get_or_create_stats(stats: dict, user_id: str) -> dict:
+def get_or_create_stats(stats: dict, user_id: int) -> dict:
     """
     Return the stats entry for a user, creating a full default entry if it doesn't exist.
     Fields:
@@ -154,81 +388,357 @@ def get_or_create_stats(stats: dict, user_id: str) -> dict:
 # ─── Channel Helpers ──────────────────────────────────────────────────────────
 # Utility for bulk-deleting messages in a channel (used during cleanup).
 
+async def delete_messages_bulk(channel, messages: list) -> int:
+    """
+    Delete the given messages with as few requests as possible and return how many were deleted.
+    Messages younger than 14 days go through Discord's bulk-delete endpoint in chunks of 100;
+    older ones (which bulk delete rejects) are deleted one by one, concurrently (bounded).
+    """
+    # Stay a few minutes inside the 14-day window so messages can't age out mid-request
+    cutoff = discord.utils.utcnow() - timedelta(days=14) + timedelta(minutes=5)
+    recent = [m for m in messages if m.created_at > cutoff]
+    old    = [m for m in messages if m.created_at <= cutoff]
+
+    for i in range(0, len(recent), 100):
+        chunk = recent[i:i + 100]
+        try:
+            await with_backoff(lambda: channel.delete_messages(chunk))
+        except discord.NotFound:
+            pass  # A lone message goes through the single-delete endpoint; bulk delete skips unknown IDs itself
+
+    results = await gather_bounded(with_backoff(m.delete) for m in old)
+    failed  = [r for r in results if isinstance(r, Exception) and not isinstance(r, discord.NotFound)]
+    if failed:
+        print(f"{len(failed)} old message(s) in {channel.name} could not be deleted: {failed[0]}")
+    return len(messages) - len(failed)
+
+
 async def clear_channel(channel):
-    """Delete up to 500 messages in a channel. Falls back to one-by-one if bulk purge fails."""
+    """Delete up to 500 messages in a channel (bulk delete for recent ones, see delete_messages_bulk)."""
     try:
-        deleted = await channel.purge(limit=500)
-        print(f"{len(deleted)} messages deleted in {channel.name}")
-    except Exception:
+        messages = [m async for m in channel.history(limit=500)]
+        deleted  = await delete_messages_bulk(channel, messages)
+        print(f"{deleted} messages deleted in {channel.name}")
+    except Exception as e:
+        print(f"Error clearing {channel.name}: {e}")
+        raise e
+
+
+def resolve_discord_objects():
+    """Look up every configured channel and role (and the scrim guild) and store them globally."""
+    global scrim_guild, register_channel, scrim_channel, game_links_channel, leaderboard_channel, event_channel
+    global registration_role, active_role, spectator_role, scrim_news_role
+    register_channel    = bot.get_channel(CHANNEL_ID)
+    scrim_channel       = bot.get_channel(SCRIM_CHAT_ID)
+    game_links_channel  = bot.get_channel(GAME_LINKS_ID)
+    leaderboard_channel = bot.get_channel(LEADERBOARD_CHANNEL_ID)
+    event_channel       = bot.get_channel(EVENT_CHANNEL_ID)
+    scrim_guild         = register_channel.guild if register_channel else None
+    registration_role   = scrim_guild.get_role(ROLE_ID) if scrim_guild else None
+    active_role         = scrim_guild.get_role(ACTIVE_ROLE_ID) if scrim_guild else None
+    spectator_role      = scrim_guild.get_role(SPECTATOR_ROLE_ID) if scrim_guild else None
+    scrim_news_role     = scrim_guild.get_role(MENTION_ROLES[1]) if scrim_guild else None
+
+
+# ─── Concurrency Helpers ──────────────────────────────────────────────────────
+# Runs independent Discord API calls side by side instead of awaiting them one after another.
+
+async def gather_bounded(coros, limit: int = ROLE_EDIT_CONCURRENCY) -> list:
+    """
+    Run the given coroutines concurrently, with at most `limit` in flight at a time.
+    Returns results in order; exceptions are returned in place instead of raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=True)
+
+
+async def gather_logged(jobs: list) -> list:
+    """Run (label, coroutine) pairs through gather_bounded and print every failure with its label."""
+    results = await gather_bounded(coro for _, coro in jobs)
+    for (label, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            print(f"{label}: {result}")
+    return results
+
+
+def spawn(coro) -> asyncio.Task:
+    """Start a background task without awaiting it, keeping a reference until it finishes and printing its failure."""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    task.add_done_callback(log_task_failure)
+    return task
+
+
+def log_task_failure(task: asyncio.Task):
+    """Done callback for spawn(): print the exception a background task ended with (cancellation is not a failure)."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Background task {task.get_coro().__name__} failed: {task.exception()}")
+
+
+def retry_after_seconds(e: discord.HTTPException):
+    """The Retry-After header of a failed request in seconds, or None if Discord didn't send one."""
+    headers = getattr(e.response, "headers", None) or {}
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def throttle():
+    """Wait for a token from the API_RATE-per-second bucket shared by every call through with_backoff."""
+    global api_tokens, api_tokens_at
+    loop = asyncio.get_running_loop()
+    while True:
+        now           = loop.time()
+        api_tokens    = min(API_RATE, api_tokens + (now - api_tokens_at) * API_RATE)
+        api_tokens_at = now
+        if api_tokens >= 1:
+            api_tokens -= 1
+            return
+        await asyncio.sleep((1 - api_tokens) / API_RATE)
+
+
+async def with_backoff(coro_factory, tries: int = RETRY_ATTEMPTS):
+    """
+    Await coro_factory() and retry when it is rate limited (HTTP 429).
+    A 429 means Discord did not process the request, so even sends are safe to retry.
+    5xx errors are not retried here: discord.py already retries 500/502/504/524 itself, and a 5xx
+    can arrive after Discord created the message, where another try would post a duplicate.
+    Every try first takes a token from throttle(), so bursts (r!delete, role syncs) are paced
+    below Discord's global limit instead of running into 429s.
+    A 429 waits exactly as long as Discord's Retry-After header asks (when present);
+    otherwise the wait is exponential backoff plus jitter.
+    coro_factory must create a fresh coroutine per call, e.g. lambda: member.add_roles(role).
+    Any other error (or the last failed try) is raised to the caller.
+    """
+    delay = RETRY_BASE_DELAY
+    for attempt in range(tries):
+        await throttle()
         try:
-            async for message in channel.history(limit=500):
-                try:
-                    await message.delete()
-                except Exception:
-                    pass
-            print(f"Channel {channel.name} cleared one by one")
-        except Exception as e:
-            print(f"Error clearing {channel.name}: {e}")
-            raise e
+            return await coro_factory()
+        except discord.HTTPException as e:
+            if e.status != 429 or attempt == tries - 1:
+                raise
+            wait = retry_after_seconds(e)
+            if wait is None:
+                wait = delay + random.random() * delay
+            await asyncio.sleep(min(wait, RETRY_MAX_DELAY))
+            delay = min(delay * 2, RETRY_MAX_DELAY)
 
 
 # ─── Reaction / Role Helpers ──────────────────────────────────────────────────
 # Functions for reading ✅ reactions and syncing the registration role.
 
-async def get_all_reacted_ids(channel, message_ids: set) -> set:
+async def prime_reactions(channel, message_ids: set) -> set:
     """
-    Fetch all tracked messages and return a set of user IDs that reacted with ✅.
+    Fetch the given messages and return a set of user IDs that reacted with ✅.
+    Several messages are read in one history walk from the oldest one (100 per request);
+    any it misses are fetched concurrently (bounded by gather_bounded). Reactor lists that
+    need paging are then walked concurrently as well.
+    Refreshes reactions_by_message with the per-message reactor sets. A cached set is only reused
+    when it was paged during this gateway session (live_reactions) and the ✅ count still equals
+    its size plus the bots recorded with it; anything else (e.g. the snapshot loaded from
+    reactions.json, which can hide a swap of reactors while offline) is paged again.
     Automatically removes message IDs that no longer exist (deleted messages).
     """
-    reacted_ids = set()
-    for msg_id in list(message_ids):
+    msg_ids  = list(message_ids)
+    messages = {}  # {message_id: Message, or the exception fetching it raised}
+    if len(msg_ids) > 1:
+        wanted = set(msg_ids)
         try:
-            msg = await channel.fetch_message(msg_id)
-            for r in msg.reactions:
-                if str(r.emoji) == "✅":
-                    async for user in r.users():
-                        if not user.bot:
-                            reacted_ids.add(user.id)
-        except discord.NotFound:
+            after = discord.Object(id=min(wanted) - 1)
+            async for m in channel.history(limit=REACTION_SCAN_LIMIT, after=after, oldest_first=True):
+                if m.id in wanted:
+                    messages[m.id] = m
+                    if len(messages) == len(wanted):
+                        break
+        except discord.HTTPException as e:
+            print(f"History scan of {channel.name} failed, fetching messages one by one: {e}")
+    missing = [msg_id for msg_id in msg_ids if msg_id not in messages]
+    fetched = await gather_bounded(
+        with_backoff(lambda msg_id=msg_id: channel.fetch_message(msg_id)) for msg_id in missing
+    )
+    messages.update(zip(missing, fetched))
+    found   = {}   # {message_id: reactor set} for the messages that were fetched
+    bots    = {}   # {message_id: bots among its reactors}, recorded in live_reactions at the end
+    to_page = {}   # {message_id: ✅ Reaction} for the messages whose reactors must be fetched
+    for msg_id in msg_ids:
+        msg = messages[msg_id]
+        if isinstance(msg, discord.NotFound):
             print(f"Message {msg_id} not found, removing from active list")
             message_ids.discard(msg_id)
+            if drop_reactors(msg_id):
+                dirty_files.add(REACTIONS_FILE)
+            continue
+        if isinstance(msg, Exception):
+            raise msg
+        # Unicode reactions keep .emoji as a plain str, so this compares without str()-ing each emoji
+        r = discord.utils.get(msg.reactions, emoji=CHECK_EMOJI)
+        # r.count includes every bot's ✅ (ours too); the reactor sets hold humans only,
+        # so a live set matches when its size plus the bots counted at paging time equals r.count
+        total     = r.count if r is not None else 0
+        cached    = reactions_by_message.get(msg_id)
+        live_bots = live_reactions.get(msg_id)
+        if total == 0:
+            found[msg_id], bots[msg_id] = set(), 0
+        elif cached is not None and live_bots is not None and len(cached) + live_bots == total:
+            found[msg_id], bots[msg_id] = cached, live_bots
+        elif total == r.me:
+            found[msg_id], bots[msg_id] = set(), 1   # Only our own ✅
+        else:
+            to_page[msg_id] = r
+
+    async def reactors(r):
+        users  = [u async for u in r.users(limit=None)]
+        humans = {u.id for u in users if not u.bot}
+        return humans, len(users) - len(humans)
+
+    paged = await gather_bounded(reactors(r) for r in to_page.values())
+    for msg_id, result in zip(to_page, paged):
+        if isinstance(result, Exception):
+            raise result
+        found[msg_id], bots[msg_id] = result
+
+    reacted_ids = set()
+    for msg_id, msg_reactors in found.items():
+        if msg_reactors != reactions_by_message.get(msg_id):
+            set_reactors(msg_id, msg_reactors)
+            dirty_files.add(REACTIONS_FILE)
+        live_reactions[msg_id] = bots[msg_id]
+        reacted_ids |= msg_reactors
     return reacted_ids
 
 
+async def get_all_reacted_ids(channel, message_ids: set) -> set:
+    """
+    Return the set of user IDs that reacted ✅ on any of the given messages.
+    Answered from reactions_by_message for sets kept live this session (live_reactions);
+    other messages are fetched via prime_reactions. Missing messages are discarded
+    from message_ids and untracked.
+    """
+    uncached_ids = {mid for mid in message_ids if mid not in live_reactions}
+    if uncached_ids:
+        await prime_reactions(channel, uncached_ids)
+        deleted_ids = {mid for mid in uncached_ids if mid not in reactions_by_message}
+        message_ids -= deleted_ids
+        untrack_messages(deleted_ids)  # Forget messages deleted without a raw delete event
+    return set().union(*(reactions_by_message.get(mid, ()) for mid in message_ids))
+
+
+async def edit_member_roles(member, add=(), remove=(), reason: str = None) -> bool:
+    """
+    Add and/or remove roles on a member. Returns False without calling Discord if nothing changes.
+    A single role change uses the per-role endpoint (add_roles / remove_roles), which leaves the
+    member's other roles alone even if another handler edits them at the same time. Only a swap
+    of several roles (Active ↔ Spectator) goes through one Modify Guild Member request (member.edit).
+    reason is shown in the server's audit log.
+    """
+    # member.get_role() is a bisect lookup on the member's role IDs, far cheaper than
+    # building member.roles (a freshly sorted list of Role objects on every access)
+    to_add    = [r for r in add if not member.get_role(r.id)]
+    to_remove = [r for r in remove if member.get_role(r.id)]
+    if not to_add and not to_remove:
+        return False
+
+    if len(to_add) + len(to_remove) == 1:
+        if to_add:
+            await with_backoff(lambda: member.add_roles(to_add[0], reason=reason))
+        else:
+            await with_backoff(lambda: member.remove_roles(to_remove[0], reason=reason))
+        return True
+
+    def patch():
+        # The full role list is built right before each send, from the live cache, so a change
+        # another handler made to a different role in the meantime is carried over, not overwritten
+        remove_ids = {r.id for r in to_remove}
+        new_roles  = [r for r in member.roles[1:] if r.id not in remove_ids]   # roles[0] is @everyone
+        new_roles += [r for r in to_add if r not in new_roles]
+        return member.edit(roles=new_roles, reason=reason)
+
+    await with_backoff(patch)
+    return True
+
+
 async def sync_roles(guild, role, reacted_ids: set):
     """
     Add the registration role to everyone in reacted_ids.
     Remove it from anyone who is no longer in reacted_ids.
+    Edits run concurrently; a permission error is re-raised after the batch finishes.
     """
-    for user_id in reacted_ids:
+    # Work out the delta up front so members that are already correct cost no API calls.
+    # registration_holders stands in for role.members, which scans every cached guild member
+    to_add_ids    = reacted_ids - registration_holders
+    to_remove_ids = registration_holders - reacted_ids
+
+    jobs = []
+    for user_id in to_add_ids:
         member = guild.get_member(user_id)
-        if member and role not in member.roles:
-            await member.add_roles(role)
-    for member in role.members:
-        if member.id not in reacted_ids:
-            await member.remove_roles(role)
-
-
-async def remove_active_role_all(guild):
-    """Strip the Active Scrim role from every member who currently has it."""
-    active_role = guild.get_role(ACTIVE_ROLE_ID)
-    if active_role:
-        for member in list(active_role.members):
-            try:
-                await member.remove_roles(active_role)
-            except Exception as e:
-                print(f"Error removing active role from {member.display_name}: {e}")
+        if member:
+            jobs.append((f"Error adding registration role to {member.display_name}", edit_member_roles(member, add=[role], reason="registration sync")))
+    for user_id in to_remove_ids:
+        member = guild.get_member(user_id)
+        if member:
+            jobs.append((f"Error removing registration role from {member.display_name}", edit_member_roles(member, remove=[role], reason="registration sync")))
 
+    results   = await gather_logged(jobs)
+    forbidden = next((r for r in results if isinstance(r, discord.Forbidden)), None)
+    if forbidden:
+        raise forbidden
+
+
+async def remove_scrim_roles_all(guild):
+    """
+    Strip the Active Scrim and Spectator Scrim roles from every member who has either.
+    Members holding both lose them with a single member.edit request.
+    """
+    scrim_roles = [r for r in (active_role, spectator_role) if r]
+    holders     = {m.id: m for r in scrim_roles for m in r.members}
+    await gather_logged([
+        (f"Error removing scrim roles from {member.display_name}", edit_member_roles(member, remove=scrim_roles, reason="scrim cleanup"))
+        for member in holders.values()
+    ])
 
-async def remove_spectator_role_all(guild):
-    """Strip the Spectator Scrim role from every member who currently has it."""
-    spectator_role = guild.get_role(SPECTATOR_ROLE_ID)
-    if spectator_role:
-        for member in list(spectator_role.members):
-            try:
-                await member.remove_roles(spectator_role)
-            except Exception as e:
-                print(f"Error removing spectator role from {member.display_name}: {e}")
+
+async def add_check_reaction(msg):
+    """Add the ✅ reaction to a registration message, retrying if Discord rate limits it."""
+    try:
+        await with_backoff(lambda: msg.add_reaction(CHECK_EMOJI))
+    except Exception as e:
+        print(f"Error adding {CHECK_EMOJI} to message {msg.id}: {e}")
+
+
+def has_reacted(user_id: int) -> bool:
+    """True if the user has ✅ on any tracked registration message (one lookup in reaction_counts)."""
+    return reaction_counts[user_id] > 0
+
+
+async def reconcile_registration_role(member, role, delay: float = REACTION_DEBOUNCE):
+    """
+    Wait `delay` seconds for a user's ✅ reactions to settle, then remove the registration
+    role if they no longer have ✅ on any tracked message. Cancelled and rescheduled by the
+    reaction events, so a burst of toggles leads to a single check.
+    """
+    await asyncio.sleep(delay)
+    if pending_role_removals.get(member.id) is asyncio.current_task():
+        del pending_role_removals[member.id]
+
+    # Messages missing from the cache (e.g. the event arrived before on_ready primed it)
+    # are fetched once in a single concurrent batch, which also fills the cache
+    uncached_ids = {mid for mid in event_by_message if mid not in reactions_by_message}
+    if uncached_ids:
+        found_ids = set(uncached_ids)
+        await prime_reactions(register_channel, found_ids)
+        untrack_messages(uncached_ids - found_ids)  # prime_reactions dropped the deleted ones
+
+    # Check the reaction cache for a ✅ on any tracked message – no API calls needed
+    if not has_reacted(member.id):
+        role_queue.put_nowait((member, role, False))
 
 
 # ─── Bot Voice Channel Helpers ───────────────────────────────────────────────
@@ -238,7 +748,7 @@ async def remove_spectator_role_all(guild):
 
 async def join_meeting_point(guild):
     """Connect the bot to the Meeting Point VC. Moves it there if already in another VC."""
-    channel = guild.get_channel(EVENT_CHANNEL_ID)
+    channel = event_channel
     if channel is None:
         print("Meeting Point channel not found, cannot join.")
         return False
@@ -274,9 +784,33 @@ async def leave_voice(guild):
 
 # Core function that decides who gets Active Scrim vs Spectator based on their VC.
 # Also updates current_game_participants so game tracking always knows who is playing.
-# Called both manually (r!event update) and automatically every minute (scrim_vc_check).
+# Called manually (r!event update) and as a periodic reconciler (check_events);
+# single moves between VCs are handled live by on_voice_state_update.
+
+def partition_vc_members(guild) -> tuple:
+    """
+    Split the non-bot members currently in voice into
+    (meeting_point_members, other_vc_members), both {user_id: Member}.
+    Walks the guild's voice states (exactly the users in voice) once. vc.members and
+    vc.voice_states each re-scan all of those states per channel, so looping over
+    guild.voice_channels costs channels × users in voice.
+    """
+    members_in_meeting_point = {}
+    members_in_other_vc      = {}
+    for user_id, state in guild._voice_states.items():
+        if not isinstance(state.channel, discord.VoiceChannel):
+            continue  # Not connected, or in a stage channel (guild.voice_channels never included those)
+        member = guild.get_member(user_id)
+        if member is None or member.bot:
+            continue
+        if state.channel.id == EVENT_CHANNEL_ID:
+            members_in_meeting_point[user_id] = member
+        else:
+            members_in_other_vc[user_id] = member
+    return members_in_meeting_point, members_in_other_vc
+
 
-async def update_scrim_vc_roles(guild):
+async def update_scrim_vc_roles(guild, partitions: tuple = None, force: bool = False):
     """
     Scans all voice channels and assigns roles accordingly:
       - Meeting Point (EVENT_CHANNEL_ID) → Spectator Scrim role (remove Active)
@@ -285,80 +819,63 @@ async def update_scrim_vc_roles(guild):
 
     Additionally adds everyone who receives Active Scrim to current_game_participants
     so that games can be attributed to everyone who played since the last r!event update.
-    """
-    global current_game_participants
 
-    active_role    = guild.get_role(ACTIVE_ROLE_ID)
-    spectator_role = guild.get_role(SPECTATOR_ROLE_ID)
+    partitions – optional result of partition_vc_members(guild) the caller already computed;
+                 skips scanning the voice channels again.
+    force      – run the pass even if nobody moved since the last one (r!event update).
+    """
+    global current_game_participants, last_vc_snapshot
 
+    # The scrim roles only exist in the scrim guild
+    if guild != scrim_guild:
+        return
     if not active_role or not spectator_role:
         print("Active or Spectator role not found!")
         return
 
-    members_in_meeting_point = set()
-    members_in_other_vc      = set()
+    if partitions is None:
+        partitions = partition_vc_members(guild)
+    members_in_meeting_point, members_in_other_vc = partitions
 
-    for vc in guild.voice_channels:
-        for member in vc.members:
-            if member.bot:
-                continue
-            if vc.id == EVENT_CHANNEL_ID:
-                members_in_meeting_point.add(member.id)
-            else:
-                members_in_other_vc.add(member.id)
+    # Same people in the same places as last pass → roles were already applied (moves in between
+    # are handled by on_voice_state_update), so the periodic reconcile has nothing to do
+    # (the snapshot is only kept after a pass with no failed edits, and on_member_update clears it
+    # when a scrim role changes to a state the snapshot doesn't expect, so failures and manual edits are retried)
+    snapshot = (frozenset(members_in_meeting_point), frozenset(members_in_other_vc))
+    if snapshot == last_vc_snapshot and not force:
+        return
 
-    all_in_vc = members_in_meeting_point | members_in_other_vc
+    # Quiet hours: nobody in a VC and nobody holding a scrim role → nothing to update or log
+    if not members_in_meeting_point and not members_in_other_vc:
+        if not active_role.members and not spectator_role.members:
+            last_vc_snapshot = snapshot
+            return
 
     # Add current game-VC players to the participant pool for this scrim session
-    current_game_participants |= members_in_other_vc
-
-    # Meeting Point → Spectator role, remove Active
-    for member_id in members_in_meeting_point:
-        member = guild.get_member(member_id)
-        if member:
-            if spectator_role not in member.roles:
-                try:
-                    await member.add_roles(spectator_role)
-                except Exception as e:
-                    print(f"Error adding spectator role to {member.display_name}: {e}")
-            if active_role in member.roles:
-                try:
-                    await member.remove_roles(active_role)
-                except Exception as e:
-                    print(f"Error removing active role from {member.display_name}: {e}")
-
-    # Other VCs → Active role, remove Spectator
-    for member_id in members_in_other_vc:
-        member = guild.get_member(member_id)
-        if member:
-            if active_role not in member.roles:
-                try:
-                    await member.add_roles(active_role)
-                except Exception as e:
-                    print(f"Error adding active role to {member.display_name}: {e}")
-            if spectator_role in member.roles:
-                try:
-                    await member.remove_roles(spectator_role)
-                except Exception as e:
-                    print(f"Error removing spectator role from {member.display_name}: {e}")
-
-    # Left all VCs → remove both roles
-    for member in list(active_role.members):
-        if member.id not in all_in_vc:
-            try:
-                await member.remove_roles(active_role)
-            except Exception as e:
-                print(f"Error removing active role from {member.display_name}: {e}")
-
-    for member in list(spectator_role.members):
-        if member.id not in all_in_vc:
-            try:
-                await member.remove_roles(spectator_role)
-            except Exception as e:
-                print(f"Error removing spectator role from {member.display_name}: {e}")
+    current_game_participants |= members_in_other_vc.keys()
+
+    # One target per member → at most one role request per member, run concurrently (bounded).
+    # edit_member_roles returns immediately for members whose roles already match.
+    scrim_roles = [active_role, spectator_role]
+    targets     = {}   # {user_id: (member, role to keep)}; None = remove both
+    for member in active_role.members + spectator_role.members:
+        targets[member.id] = (member, None)
+    for member in members_in_meeting_point.values():
+        targets[member.id] = (member, spectator_role)
+    for member in members_in_other_vc.values():
+        targets[member.id] = (member, active_role)
+
+    jobs = []
+    for member, keep in targets.values():
+        add    = [keep] if keep else []
+        remove = [r for r in scrim_roles if r is not keep]
+        jobs.append((f"Error updating scrim roles for {member.display_name}", edit_member_roles(member, add=add, remove=remove, reason="scrim VC check")))
+
+    results          = await gather_logged(jobs)
+    last_vc_snapshot = None if any(isinstance(r, Exception) for r in results) else snapshot
 
     print(
-        f"[scrim_vc_check] Meeting Point: {len(members_in_meeting_point)} spectators | "
+        f"[vc_roles] Meeting Point: {len(members_in_meeting_point)} spectators | "
         f"Other VCs: {len(members_in_other_vc)} active players | "
         f"Participant pool: {len(current_game_participants)}"
     )
@@ -385,12 +902,11 @@ async def log_game(guild, winner_ids: set, source: str = "manual"):
         print(f"[log_game] No participants tracked yet, skipping ({source})")
         return None
 
-    stats      = load_stats()
-    leaderboard = load_leaderboard()
+    stats       = stats_cache
+    leaderboard = leaderboard_cache
 
     for user_id in current_game_participants:
-        uid_str    = str(user_id)
-        user_stats = get_or_create_stats(stats, uid_str)
+        user_stats = get_or_create_stats(stats, user_id)
         user_stats["games_played"] += 1
 
         if user_id in winner_ids:
@@ -399,12 +915,11 @@ async def log_game(guild, winner_ids: set, source: str = "manual"):
             if user_stats["win_streak"] > user_stats["best_streak"]:
                 user_stats["best_streak"] = user_stats["win_streak"]
             # Also update legacy leaderboard
-            leaderboard[uid_str] = leaderboard.get(uid_str, 0) + 1
+            leaderboard[user_id] = leaderboard.get(user_id, 0) + 1
         else:
             user_stats["win_streak"] = 0  # Loss or no-show breaks the streak
 
-    save_stats(stats)
-    save_leaderboard(leaderboard)
+    dirty_files.update((STATS_FILE, LEADERBOARD_FILE))
 
     winner_names = []
     for uid in winner_ids:
@@ -420,23 +935,47 @@ async def log_game(guild, winner_ids: set, source: str = "manual"):
     return winner_names
 
 
-# ─── Auto VC Check Task ───────────────────────────────────────────────────────
-# Runs every 60 seconds once scrim_active is True (set by r!event update).
-# Automatically keeps Active/Spectator roles up to date as people move between VCs.
+# ─── State Flush Task ─────────────────────────────────────────────────────────
+# Writes changed JSON files in the background so commands and events never wait on disk I/O.
 
-@tasks.loop(minutes=1)
-async def scrim_vc_check():
-    """Every minute: if a scrim is active, re-evaluate all VC roles across all guilds."""
-    if not scrim_active:
+@tasks.loop(seconds=FLUSH_INTERVAL)
+async def flush_state():
+    """Every FLUSH_INTERVAL seconds: persist whatever changed since the last tick, off the event loop."""
+    snapshots = take_dirty_snapshots()
+    if not snapshots:
         return
-    for guild in bot.guilds:
-        await update_scrim_vc_roles(guild)
+    # All files changed in this window are written in one worker-thread hop
+    for path, e in await asyncio.to_thread(write_snapshots, snapshots):
+        dirty_files.add(path)  # Retry on the next tick
+        print(f"Error writing {path}: {e}")
 
 
-@scrim_vc_check.before_loop
-async def before_scrim_vc_check():
-    """Wait until the bot is fully connected before starting the loop."""
-    await bot.wait_until_ready()
+# ─── Role Queue Worker ────────────────────────────────────────────────────────
+# Reaction events only queue role changes; this single worker applies them in order at a
+# steady pace, so a burst of sign-ups can't flood the API with add_roles/remove_roles calls.
+
+async def role_worker():
+    """Apply queued registration-role changes one by one, at most ROLE_QUEUE_RATE per second."""
+    while True:
+        member, role, add = await role_queue.get()
+        try:
+            # Reaction payloads carry a detached Member snapshot; use the cached one so role changes
+            # made since it was queued (e.g. an earlier queued add) are seen
+            member = (scrim_guild.get_member(member.id) if scrim_guild else None) or member
+            # Re-check when it's our turn – an earlier queued change or a role sync may have done it already,
+            # or the user may have taken their ✅ back (add) or reacted again (removal) while the item waited
+            has_role = member.get_role(role.id) is not None
+            if has_role == add or add != has_reacted(member.id):
+                continue
+            if add:
+                await with_backoff(lambda: member.add_roles(role))
+            else:
+                await with_backoff(lambda: member.remove_roles(role))
+        except Exception as e:
+            print(f"Error {'adding' if add else 'removing'} registration role for {member.display_name}: {e}")
+        finally:
+            role_queue.task_done()
+        await asyncio.sleep(1 / ROLE_QUEUE_RATE)
 
 
 # ─── Bot Ready Event ──────────────────────────────────────────────────────────
@@ -445,46 +984,138 @@ async def before_scrim_vc_check():
 
 @bot.event
 async def on_ready():
+    global state_loaded, role_worker_task
     print("Bot ready")
-    channel     = bot.get_channel(CHANNEL_ID)
-    guild       = channel.guild
-    role        = guild.get_role(ROLE_ID)
-    data        = load_data()
-    message_ids = get_all_message_ids(data)
-    reacted_ids = await get_all_reacted_ids(channel, message_ids)
-    await sync_roles(guild, role, reacted_ids)
-    print(f"Roles synced across {len(message_ids)} active message(s)")
-    check_events.start()
-    scrim_vc_check.start()
+    resolve_discord_objects()
+    seed_registration_holders()
+    channel     = register_channel
+    guild       = scrim_guild
+    role        = registration_role
+    # Read the JSON files once; on reconnects the in-memory mirrors are newer than the disk
+    if not state_loaded:
+        data, leaderboard, stats, saved_reactions, saved_state = await asyncio.to_thread(load_state_files)
+        load_tracked_events(data)
+        leaderboard_cache.update(leaderboard)
+        stats_cache.update(stats)
+        bot_state.update(saved_state)
+        warned_events.update({int(eid): start_ts for eid, start_ts in saved_state.get("warned_events", {}).items()})
+        bot_state["warned_events"] = warned_events   # Same dict, so every flush of state.json includes it
+        # Seed the reaction cache from the last snapshot (not trusted as live: prime_reactions re-pages it)
+        for mid, users in saved_reactions.items():
+            if mid in event_by_message:
+                set_reactors(mid, users)
+        state_loaded = True
+    message_ids = set(event_by_message)
+    # A new gateway session may have missed reaction events, so no cached set counts as live any more
+    live_reactions.clear()
+    if message_ids:
+        # Full REST walk once per connect: catches reactions added/removed while the bot was offline.
+        # A failure here is logged, so the loops below still start
+        try:
+            original    = set(message_ids)
+            reacted_ids = await prime_reactions(channel, message_ids)
+            # Forget messages deleted while offline (diffed against the snapshot, so an event
+            # r!create tracks during the await is kept)
+            untrack_messages(original - message_ids)
+            await sync_roles(guild, role, reacted_ids)
+            print(f"Roles synced across {len(event_by_message)} active message(s)")
+        except Exception as e:
+            print(f"Error resyncing registration roles: {e}")
+    else:
+        # Nothing tracked (no scrim posted, or message_ids.json missing): syncing against an empty
+        # reactor set would strip the registration role from everyone, so leave roles alone
+        print("No tracked messages, skipping role resync")
+    if not check_events.is_running():
+        check_events.start()
+    if not flush_state.is_running():
+        flush_state.start()
+    if role_worker_task is None:
+        role_worker_task = spawn(role_worker())
 
 
-# ─── Event Warning & Auto-Start Loop ─────────────────────────────────────────
-# Runs every minute. Handles two things:
+@bot.event
+async def on_resumed():
+    """Re-resolve cached channel/role objects after the gateway session resumes."""
+    resolve_discord_objects()
+
+
+@bot.event
+async def on_guild_available(guild):
+    """Re-resolve when the scrim guild comes back after an outage (its channel/role objects are rebuilt)."""
+    if guild.get_channel(CHANNEL_ID):
+        resolve_discord_objects()
+        seed_registration_holders()
+
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    """Drop the stored handle when a configured channel is deleted, so handlers see None, not a dead object."""
+    if channel.id in (CHANNEL_ID, SCRIM_CHAT_ID, GAME_LINKS_ID, LEADERBOARD_CHANNEL_ID, EVENT_CHANNEL_ID):
+        resolve_discord_objects()
+
+
+@bot.event
+async def on_guild_role_delete(role):
+    """Same for the configured roles (a deleted registration role also empties registration_holders)."""
+    if role.id in (ROLE_ID, ACTIVE_ROLE_ID, SPECTATOR_ROLE_ID, MENTION_ROLES[1]):
+        resolve_discord_objects()
+        seed_registration_holders()
+
+
+# ─── Event Warning, Auto-Start & VC Check Loop ───────────────────────────────
+# Runs every minute. Handles three things:
 #   1. Sends a 30-minute warning embed to the registration channel before an event starts.
 #   2. Automatically calls event.start() when the scheduled start time is reached.
+#   3. Once scrim_active is True (set by r!event update), re-checks every member's
+#      Active/Spectator role every VC_RECONCILE_INTERVAL seconds (moves are handled live below).
 
 @tasks.loop(minutes=1)
 async def check_events():
+    global last_vc_reconcile
     now = datetime.now(tz=timezone.utc)
+
+    # Forget warnings for events that started over WARNED_TTL ago so warned_events stays bounded
+    stale = [eid for eid, start_ts in warned_events.items() if now.timestamp() - start_ts > WARNED_TTL]
+    for event_id in stale:
+        del warned_events[event_id]
+    if stale:
+        dirty_files.add(STATE_FILE)
+
+    # Full VC role pass every VC_RECONCILE_INTERVAL seconds to catch drift (missed voice events,
+    # manual role edits); on_voice_state_update handles individual moves in between.
+    # Guarded so a failed role pass never stops the event checks below (or the loop)
+    if scrim_active and scrim_guild and (
+        last_vc_reconcile is None or (now - last_vc_reconcile).total_seconds() >= VC_RECONCILE_INTERVAL
+    ):
+        last_vc_reconcile = now
+        try:
+            await update_scrim_vc_roles(scrim_guild)
+        except Exception as e:
+            print(f"Error updating scrim VC roles: {e}")
+
     for guild in bot.guilds:
-        events = await guild.fetch_scheduled_events()
-        for event in events:
+        # The gateway keeps guild.scheduled_events current (guild_scheduled_events intent),
+        # so the minute tick reads the cache instead of a REST round-trip per guild
+        for event in guild.scheduled_events:
             if event.status == discord.EventStatus.scheduled:
                 diff = (event.start_time - now).total_seconds()
+                if diff > 1800 or diff < -60:
+                    continue  # Outside both windows below (most events, most ticks)
 
                 # 30-minute warning (fires once per event, between 29–30 min remaining)
                 if 1740 <= diff <= 1800 and event.id not in warned_events:
                     try:
-                        channel    = bot.get_channel(CHANNEL_ID)
-                        role       = guild.get_role(ROLE_ID)
+                        channel    = register_channel
+                        role       = registration_role
                         event_link = f"https://discord.com/events/{guild.id}/{event.id}"
                         embed = discord.Embed(
                             title=f"⏰ {event.name} starts in 30 minutes!",
                             description=f"Get ready! The event **{event.name}** starts in 30 minutes.\n[View Event]({event_link})",
                             color=discord.Color.yellow()
                         )
-                        await channel.send(content=f"{role.mention}", embed=embed)
-                        warned_events.add(event.id)
+                        await with_backoff(lambda: channel.send(content=f"{role.mention}", embed=embed))
+                        warned_events[event.id] = event.start_time.timestamp()
+                        dirty_files.add(STATE_FILE)
                         print(f"30 minute warning sent for {event.name}")
                     except Exception as e:
                         print(f"Error sending 30 minute warning: {e}")
@@ -494,15 +1125,15 @@ async def check_events():
                     try:
                         await event.start()
                         print(f"Event {event.name} started!")
-                        channel    = bot.get_channel(CHANNEL_ID)
-                        role       = guild.get_role(ROLE_ID)
+                        channel    = register_channel
+                        role       = registration_role
                         event_link = f"https://discord.com/events/{guild.id}/{event.id}"
                         embed = discord.Embed(
                             title=f"🟢 {event.name} has started!",
                             description=f"The event **{event.name}** is now live!\n[Join Event]({event_link})",
                             color=discord.Color.green()
                         )
-                        await channel.send(content=f"{role.mention}", embed=embed)
+                        await with_backoff(lambda: channel.send(content=f"{role.mention}", embed=embed))
                     except Exception as e:
                         print(f"Error starting event {event.name}: {e}")
 
@@ -513,6 +1144,34 @@ async def before_check():
     await bot.wait_until_ready()
 
 
+# ─── Live VC Role Tracking ────────────────────────────────────────────────────
+# While a scrim is active, a member switching voice channels gets their scrim role
+# updated right away – one role edit for that member instead of a full VC scan.
+# Same rules as update_scrim_vc_roles; check_events still reconciles periodically.
+
+@bot.event
+async def on_voice_state_update(member, before, after):
+    if not scrim_active or member.bot or member.guild != scrim_guild:
+        return
+    if before.channel == after.channel or not active_role or not spectator_role:
+        return  # Mute/deafen/stream changes, or roles missing
+
+    if not isinstance(after.channel, discord.VoiceChannel):
+        keep = None               # Left voice (or moved to a stage channel)
+    elif after.channel.id == EVENT_CHANNEL_ID:
+        keep = spectator_role     # Meeting Point
+    else:
+        keep = active_role        # Any game VC
+        current_game_participants.add(member.id)
+
+    add    = [keep] if keep else []
+    remove = [r for r in (active_role, spectator_role) if r is not keep]
+    try:
+        await edit_member_roles(member, add=add, remove=remove, reason="scrim VC move")
+    except Exception as e:
+        print(f"Error updating scrim roles for {member.display_name}: {e}")
+
+
 # ─── Auto Event Restart Guard ─────────────────────────────────────────────────
 # Discord automatically ends a voice-channel event when the last person leaves the VC.
 # This listener detects that and immediately recreates + restarts the event so the scrim
@@ -536,8 +1195,7 @@ async def on_scheduled_event_update(before, after):
         return
 
     # Only restart events that are tracked (i.e. created via r!create)
-    data = load_data()
-    if str(after.id) not in data:
+    if str(after.id) not in tracked_events:
         return
 
     print(f"Event '{after.name}' was auto-ended by Discord – restarting it...")
@@ -548,16 +1206,15 @@ async def on_scheduled_event_update(before, after):
             name=after.name,
             description=after.description or "",
             start_time=datetime.now(tz=timezone.utc),
-            channel=guild.get_channel(EVENT_CHANNEL_ID),
+            channel=event_channel,
             entity_type=discord.EntityType.voice,
             privacy_level=discord.PrivacyLevel.guild_only
         )
         await new_event.start()
 
         # Re-link the original registration message to the new event ID
-        old_msg_id = data.pop(str(after.id))
-        data[str(new_event.id)] = old_msg_id
-        save_data(data)
+        old_msg_id = tracked_events.pop(str(after.id))
+        track_event(new_event.id, old_msg_id)
 
         print(f"Event restarted as '{new_event.name}' (id: {new_event.id})")
     except Exception as e:
@@ -579,20 +1236,20 @@ async def on_message(message):
     if message.channel.id != GAME_LINKS_ID or message.author.bot:
         return
 
-    content_lower = message.content.lower()
-    if "winner" not in content_lower:
+    if not scrim_active:
+        return  # Only track games during an active scrim session
+
+    # Cheapest checks first: no mentions means no winners, so the content is never searched
+    if not message.mentions or not WINNER_RE.search(message.content):
         return
 
     winner_ids = {m.id for m in message.mentions if not m.bot}
     if not winner_ids:
         return
 
-    if not scrim_active:
-        return  # Only track games during an active scrim session
-
     winner_names = await log_game(message.guild, winner_ids, source="auto")
     if winner_names is not None:
-        await message.add_reaction("✅")  # Confirm the game was recorded
+        await with_backoff(lambda: message.add_reaction(CHECK_EMOJI))  # Confirm the game was recorded
         print(f"[auto] Game recorded from game-links post by {message.author.display_name}")
 
 
@@ -633,7 +1290,7 @@ async def game(ctx, subcommand: str = None, *, args=None):
         await ctx.send("⚠️ Game could not be logged, no participants tracked.")
         return
 
-    stats = load_stats()
+    stats = stats_cache
     loser_names = []
     for uid in current_game_participants:
         if uid not in winner_ids:
@@ -666,8 +1323,7 @@ async def game(ctx, subcommand: str = None, *, args=None):
     for uid in winner_ids:
         member = ctx.guild.get_member(uid)
         if member:
-            uid_str    = str(uid)
-            user_stats = stats.get(uid_str, {})
+            user_stats = stats.get(uid, {})
             streak     = user_stats.get("win_streak", 0)
             best       = user_stats.get("best_streak", 0)
             fire       = " 🔥" if streak >= 3 else ""
@@ -678,14 +1334,12 @@ async def game(ctx, subcommand: str = None, *, args=None):
     await ctx.send(embed=embed)
 
     # Post a winner announcement in the game-links channel
-    game_links_channel = bot.get_channel(GAME_LINKS_ID)
     if game_links_channel:
         winner_mentions = " ".join(f"<@{uid}>" for uid in winner_ids)
-        total_games = load_stats().get(str(next(iter(winner_ids))), {}).get("games_won", "?")
+        total_games = stats.get(next(iter(winner_ids)), {}).get("games_won", "?")
         streak_parts = []
         for uid in winner_ids:
-            uid_str    = str(uid)
-            user_stats = load_stats().get(uid_str, {})
+            user_stats = stats.get(uid, {})
             streak     = user_stats.get("win_streak", 0)
             fire       = " 🔥" if streak >= 3 else ""
             member     = ctx.guild.get_member(uid)
@@ -708,7 +1362,7 @@ async def game(ctx, subcommand: str = None, *, args=None):
                 inline=False
             )
         announcement.set_footer(text=f"Logged by {ctx.author.display_name}")
-        await game_links_channel.send(embed=announcement)
+        await with_backoff(lambda: game_links_channel.send(embed=announcement))
 
 
 # ─── Command: r!create ────────────────────────────────────────────────────────
@@ -718,23 +1372,17 @@ async def game(ctx, subcommand: str = None, *, args=None):
 @bot.command()
 @has_allowed_role()
 async def create(ctx, *, args):
-    parts = [p.strip() for p in args.split(",")]
-    if len(parts) < 3:
-        await ctx.send("❌ Wrong format! Use: `r!create Title, Description, <t:TIMESTAMP:R>`")
+    match = CREATE_RE.match(args)
+    if match is None:
+        if args.count(",") < 2:
+            await ctx.send("❌ Wrong format! Use: `r!create Title, Description, <t:TIMESTAMP:R>`")
+        else:
+            await ctx.send("❌ Invalid timestamp!")
         return
 
-    title       = parts[0]
-    description = parts[1]
+    title, description, timestamp = match.group(1), match.group(2), int(match.group(3) or match.group(4))
 
-    try:
-        raw       = parts[2].strip("<>").replace("t:", "").split(":")[0]
-        timestamp = int(raw)
-    except ValueError:
-        await ctx.send("❌ Invalid timestamp!")
-        return
-
-    guild         = ctx.guild
-    event_channel = guild.get_channel(EVENT_CHANNEL_ID)
+    guild = ctx.guild
 
     if event_channel is None:
         await ctx.send("❌ Meeting Point channel not found!")
@@ -759,24 +1407,28 @@ async def create(ctx, *, args):
         return
 
     event_link = f"https://discord.com/events/{guild.id}/{event.id}"
-    channel    = bot.get_channel(CHANNEL_ID)
-    mentions   = " ".join(f"<@&{r}>" for r in MENTION_ROLES)
+    channel    = register_channel
+    mentions   = MENTION_TEXT
 
     embed = discord.Embed(title=title, description=description, url=event_link)
     embed.add_field(name="Date",  value=f"<t:{timestamp}:F>", inline=False)
     embed.add_field(name="Event", value=f"[Click here]({event_link})", inline=False)
 
     try:
-        msg = await channel.send(content=mentions, embed=embed)
-        await msg.add_reaction("✅")
+        msg = await with_backoff(lambda: channel.send(content=mentions, embed=embed))
     except Exception as e:
         await ctx.send(f"❌ Event created but message could not be posted: `{e}`")
         return
 
+    # The reaction endpoint is heavily rate limited – add ✅ in the background so the
+    # command can confirm right away
+    spawn(add_check_reaction(msg))
+
     # Save the event ID → message ID mapping so reactions can be tracked
-    data = load_data()
-    data[str(event.id)] = msg.id
-    save_data(data)
+    track_event(event.id, msg.id)
+    set_reactors(msg.id, set())
+    live_reactions[msg.id] = 1   # Our own ✅ (added in the background); the reaction events keep the set live
+    dirty_files.add(REACTIONS_FILE)
 
     await ctx.send(f"✅ Event **{title}** successfully created and posted! 🎉\n{event_link}")
     print(f"Created event {event.id} and message {msg.id}")
@@ -804,39 +1456,24 @@ async def delete(ctx, *, args):
 
     await ctx.send("⏳ Deleting event, messages and roles...")
 
-    guild              = ctx.guild
-    role               = guild.get_role(ROLE_ID)
-    register_channel   = bot.get_channel(CHANNEL_ID)
-    scrim_channel      = bot.get_channel(SCRIM_CHAT_ID)
-    game_links_channel = bot.get_channel(GAME_LINKS_ID)
+    guild = ctx.guild
+    role  = registration_role
 
-    # Find the currently active event
-    active_event = None
-    try:
-        events = await guild.fetch_scheduled_events()
-        for event in events:
-            if event.status == discord.EventStatus.active:
-                active_event = event
-                break
-    except Exception as e:
-        await ctx.send(f"⚠️ Could not check for active event: `{e}` - continuing cleanup...")
+    # Find the currently active event (from the gateway-maintained cache, no API call)
+    active_event = next((e for e in guild.scheduled_events if e.status == discord.EventStatus.active), None)
 
     # Bot leaves the Meeting Point voice channel
     await leave_voice(guild)
 
     # Remove all Active and Spectator roles first
-    await remove_active_role_all(guild)
-    await remove_spectator_role_all(guild)
+    await remove_scrim_roles_all(guild)
 
     # Re-sync the registration role (without the just-ended event)
     try:
-        data = load_data()
+        remaining_message_ids = set(event_by_message)
         if active_event:
-            event_id_str = str(active_event.id)
-            if event_id_str in data:
-                del data[event_id_str]
-        remaining_message_ids = get_all_message_ids(data)
-        reacted_ids           = await get_all_reacted_ids(register_channel, remaining_message_ids)
+            remaining_message_ids.discard(tracked_events.get(str(active_event.id)))
+        reacted_ids = await get_all_reacted_ids(register_channel, remaining_message_ids)
         await sync_roles(guild, role, reacted_ids)
         print("Roles synced after event deletion")
     except discord.Forbidden:
@@ -848,60 +1485,42 @@ async def delete(ctx, *, args):
         await ctx.send(f"❌ Error syncing roles: `{e}`")
         return
 
-    # Delete only the tracked registration messages for this scrim session
+    # Delete the tracked registration messages for this scrim session, together with any
+    # untracked bot messages (e.g. the 30-min warning and start notification), in bulk requests.
+    # Tracked messages need no fetch: bulk delete only takes IDs, and a PartialMessage's
+    # created_at (for the 14-day check) comes from its snowflake.
     try:
-        data = load_data()
-        all_tracked_msg_ids = list(get_all_message_ids(data))
-
-        for msg_id in all_tracked_msg_ids:
-            try:
-                msg = await register_channel.fetch_message(msg_id)
-                await msg.delete()
-            except discord.NotFound:
-                pass
-            except Exception as e:
-                print(f"Error deleting tracked message {msg_id}: {e}")
-
-        # Also delete any untracked bot messages from this session
-        # (e.g. the 30-min warning and start notification)
-        async for message in register_channel.history(limit=100):
-            if message.author == bot.user and message.id not in all_tracked_msg_ids:
-                # Only delete if it's NOT a registration message for a future event
-                remaining_data = {k: v for k, v in data.items() if v not in all_tracked_msg_ids}
-                if message.id not in get_all_message_ids(remaining_data):
-                    try:
-                        await message.delete()
-                    except discord.NotFound:
-                        pass
+        all_tracked_msg_ids = list(event_by_message)
+
+        tracked_set   = set(all_tracked_msg_ids)
+        # Session leftovers are newer than the oldest tracked post, so the scan stops there
+        # (newest first, still at most 100 messages) instead of paging into older chatter
+        after         = discord.Object(id=min(tracked_set) - 1) if tracked_set else None
+        leftover_msgs = [
+            message async for message in register_channel.history(limit=100, after=after, oldest_first=False)
+            if message.author == bot.user and message.id not in tracked_set
+        ]
+        tracked_msgs  = [register_channel.get_partial_message(msg_id) for msg_id in all_tracked_msg_ids]
+        await delete_messages_bulk(register_channel, tracked_msgs + leftover_msgs)
 
-        # Remove only the active event from data, keep future events intact
-        if active_event:
-            event_id_str = str(active_event.id)
-            if event_id_str in data:
-                del data[event_id_str]
-        # Also remove any stale entries whose messages were just deleted
-        for msg_id in all_tracked_msg_ids:
-            for eid, mid in list(data.items()):
-                if mid == msg_id:
-                    del data[eid]
-                    break
-        save_data(data)
+        # Forget every event whose message was just deleted (including the active one) in a single write
+        untrack_messages(all_tracked_msg_ids)
         print("Register channel messages deleted")
     except Exception as e:
         manually_deleting = False
         await ctx.send(f"❌ Error deleting register messages: `{e}`")
         return
 
-    # Clear the scrim chat and game-links channels
-    try:
-        await clear_channel(scrim_channel)
-    except Exception as e:
-        await ctx.send(f"❌ Error clearing scrim chat: `{e}`")
-
-    try:
-        await clear_channel(game_links_channel)
-    except Exception as e:
-        await ctx.send(f"❌ Error clearing game links: `{e}`")
+    # Clear the scrim chat and game-links channels (side by side – they don't share rate limits)
+    scrim_result, links_result = await asyncio.gather(
+        clear_channel(scrim_channel),
+        clear_channel(game_links_channel),
+        return_exceptions=True
+    )
+    if isinstance(scrim_result, Exception):
+        await ctx.send(f"❌ Error clearing scrim chat: `{scrim_result}`")
+    if isinstance(links_result, Exception):
+        await ctx.send(f"❌ Error clearing game links: `{links_result}`")
 
     # End the active Discord event
     if active_event:
@@ -913,9 +1532,8 @@ async def delete(ctx, *, args):
 
     # Delete any leftover past events (ended/completed) that are still on the server
     try:
-        events = await guild.fetch_scheduled_events()
         past_count = 0
-        for event in events:
+        for event in guild.scheduled_events:
             if event.status in (discord.EventStatus.ended, discord.EventStatus.completed):
                 try:
                     await event.delete()
@@ -953,20 +1571,19 @@ async def cancel(ctx, *, args):
 
     await ctx.send("⏳ Cancelling event and deleting messages...")
 
-    guild            = ctx.guild
-    role             = guild.get_role(ROLE_ID)
-    register_channel = bot.get_channel(CHANNEL_ID)
+    guild = ctx.guild
+    role  = registration_role
 
-    target_event = None
-    try:
-        events = await guild.fetch_scheduled_events()
-        for event in events:
-            if event.id == event_id:
-                target_event = event
-                break
-    except Exception as e:
-        await ctx.send(f"❌ Error finding event: `{e}`")
-        return
+    # Cached by the gateway; only ask the API if the cache doesn't know the event
+    target_event = guild.get_scheduled_event(event_id)
+    if target_event is None:
+        try:
+            target_event = await guild.fetch_scheduled_event(event_id)
+        except discord.NotFound:
+            pass
+        except Exception as e:
+            await ctx.send(f"❌ Error finding event: `{e}`")
+            return
 
     if target_event is None:
         await ctx.send("❌ Event not found! Make sure the ID is correct.")
@@ -984,17 +1601,14 @@ async def cancel(ctx, *, args):
         return
 
     try:
-        data         = load_data()
-        event_id_str = str(event_id)
-        if event_id_str in data:
-            msg_id = data[event_id_str]
+        msg_id = tracked_events.get(str(event_id))
+        if msg_id is not None:
             try:
-                msg = await register_channel.fetch_message(msg_id)
-                await msg.delete()
+                # Deleting only needs the ID – no GET for the full message first
+                await with_backoff(register_channel.get_partial_message(msg_id).delete)
             except discord.NotFound:
                 pass
-            del data[event_id_str]
-            save_data(data)
+            untrack_event(event_id)
         else:
             await ctx.send("⚠️ Event cancelled but no linked message was found.")
             return
@@ -1003,8 +1617,7 @@ async def cancel(ctx, *, args):
         return
 
     try:
-        remaining_message_ids = get_all_message_ids(data)
-        reacted_ids           = await get_all_reacted_ids(register_channel, remaining_message_ids)
+        reacted_ids = await get_all_reacted_ids(register_channel, set(event_by_message))
         await sync_roles(guild, role, reacted_ids)
         print("Roles synced after cancellation")
     except Exception as e:
@@ -1015,8 +1628,8 @@ async def cancel(ctx, *, args):
 
 
 # ─── Command: r!event update ─────────────────────────────────────────────────
-# Scans all voice channels, assigns Active/Spectator roles, and starts the 1-minute
-# auto-check loop so roles stay updated for the rest of the scrim session.
+# Scans all voice channels, assigns Active/Spectator roles, and starts live VC role tracking
+# so roles stay updated for the rest of the scrim session.
 # Also resets current_game_participants so each update starts a fresh game tracking pool.
 # Also records attendance stats for registered players.
 #
@@ -1035,10 +1648,7 @@ async def event(ctx, *, args):
     if subcommand == "update":
         await ctx.send("⏳ Checking voice channels and assigning roles...")
 
-        guild            = ctx.guild
-        active_role      = guild.get_role(ACTIVE_ROLE_ID)
-        spectator_role   = guild.get_role(SPECTATOR_ROLE_ID)
-        register_channel = bot.get_channel(CHANNEL_ID)
+        guild = ctx.guild
 
         if active_role is None:
             await ctx.send("❌ Active Scrim role not found!")
@@ -1050,56 +1660,36 @@ async def event(ctx, *, args):
         # Reset participant pool so this update starts a clean tracking window
         current_game_participants = set()
 
-        # Collect which members are where
-        members_in_meeting_point = set()
-        members_in_other_vc      = set()
-        for vc in guild.voice_channels:
-            for member in vc.members:
-                if member.bot:
-                    continue
-                if vc.id == EVENT_CHANNEL_ID:
-                    members_in_meeting_point.add(member.id)
-                else:
-                    members_in_other_vc.add(member.id)
+        # Collect which members are where (reused for attendance, roles and the summary)
+        partitions = partition_vc_members(guild)
+        members_in_meeting_point, members_in_other_vc = partitions
 
         # Record attendance for registered players
-        data        = load_data()
-        message_ids = get_all_message_ids(data)
-        reacted_ids = await get_all_reacted_ids(register_channel, message_ids)
-        all_in_vc   = members_in_meeting_point | members_in_other_vc
+        reacted_ids = await get_all_reacted_ids(register_channel, set(event_by_message))
+        all_in_vc   = members_in_meeting_point.keys() | members_in_other_vc.keys()
 
-        stats = load_stats()
         for user_id in reacted_ids:
-            uid_str    = str(user_id)
-            user_stats = get_or_create_stats(stats, uid_str)
+            user_stats = get_or_create_stats(stats_cache, user_id)
             user_stats["registered"] += 1
-            if user_id in all_in_vc:
-                user_stats["attended"] += 1
-        save_stats(stats)
+            user_stats["attended"]   += user_id in all_in_vc
+        if reacted_ids:
+            dirty_files.add(STATS_FILE)
 
         # Assign Active / Spectator roles based on current VC positions
         # (also populates current_game_participants with players in game VCs)
-        await update_scrim_vc_roles(guild)
+        await update_scrim_vc_roles(guild, partitions, force=True)
 
         # Bot joins Meeting Point so Discord never auto-ends the event due to empty VC
         await join_meeting_point(guild)
 
-        # Activate the per-minute auto-check for the rest of the scrim
+        # Activate live VC role tracking for the rest of the scrim
         scrim_active = True
 
         # Build a readable summary for the confirmation message
-        active_names = [
-            guild.get_member(uid).display_name
-            for uid in members_in_other_vc
-            if guild.get_member(uid) and not guild.get_member(uid).bot
-        ]
-        spectator_names = [
-            guild.get_member(uid).display_name
-            for uid in members_in_meeting_point
-            if guild.get_member(uid) and not guild.get_member(uid).bot
-        ]
+        active_names    = [m.display_name for m in members_in_other_vc.values()]
+        spectator_names = [m.display_name for m in members_in_meeting_point.values()]
 
-        lines = ["✅ Update complete! Auto-check every minute is now **active**."]
+        lines = ["✅ Update complete! Live VC role tracking is now **active**."]
         if active_names:
             lines.append(f"🎮 **Active Scrim** ({len(active_names)}): {', '.join(active_names)}")
         else:
@@ -1114,24 +1704,36 @@ async def event(ctx, *, args):
     elif subcommand == "leaderboard":
         await ctx.send("⏳ Scanning game links and updating leaderboard...")
 
-        guild               = ctx.guild
-        game_links_channel  = bot.get_channel(GAME_LINKS_ID)
-        leaderboard_channel = bot.get_channel(LEADERBOARD_CHANNEL_ID)
-
-        leaderboard = load_leaderboard()
+        leaderboard = leaderboard_cache
         games_found = 0
+        wins        = Counter()
+
+        # Only messages after the last counted one are scanned, so each game is counted once
+        # and repeat runs fetch just the new messages (the first run scans the last 200)
+        cursor = bot_state.get("leaderboard_cursor")
+        if cursor:
+            history = game_links_channel.history(limit=None, after=discord.Object(id=cursor), oldest_first=True)
+        else:
+            history = game_links_channel.history(limit=200)
 
         # Count wins: any message containing "winner" + a user mention counts as one game
-        async for message in game_links_channel.history(limit=200):
-            content_lower = message.content.lower()
-            if "winner" in content_lower and message.mentions:
-                for member in message.mentions:
-                    if not member.bot:
-                        uid = str(member.id)
-                        leaderboard[uid] = leaderboard.get(uid, 0) + 1
+        newest_id = cursor or 0
+        async for message in history:
+            newest_id = max(newest_id, message.id)
+            # Cheap mentions check first – most chatter has none, so it is never searched
+            if message.mentions and WINNER_RE.search(message.content):
+                wins.update(member.id for member in message.mentions if not member.bot)
                 games_found += 1
 
-        if games_found == 0:
+        if newest_id != (cursor or 0):
+            bot_state["leaderboard_cursor"] = newest_id
+            dirty_files.add(STATE_FILE)
+
+        # Merge the tally into the leaderboard once, one write per player
+        for uid, count in wins.items():
+            leaderboard[uid] = leaderboard.get(uid, 0) + count
+
+        if games_found == 0 and not leaderboard:
             await ctx.send(
                 "⚠️ No winner messages found in game-links channel!\n"
                 "Who won? Use `r!winner USER_ID` to manually add a win.\n"
@@ -1139,21 +1741,18 @@ async def event(ctx, *, args):
             )
             return
 
-        save_leaderboard(leaderboard)
+        if wins:
+            dirty_files.add(LEADERBOARD_FILE)
 
-        sorted_lb   = sorted(leaderboard.items(), key=lambda x: x[1], reverse=True)
+        sorted_lb   = heapq.nlargest(LEADERBOARD_SIZE, leaderboard.items(), key=lambda x: x[1])
         medals      = ["🥇", "🥈", "🥉"]
-        description = ""
+        rows        = []
         for i, (user_id, points) in enumerate(sorted_lb):
-            member = guild.get_member(int(user_id))
-            name   = member.mention if member else f"<@{user_id}>"
-            if i < 3:
-                prefix = medals[i]
-            elif points >= 3:
-                prefix = "🏅"
-            else:
-                prefix = "▪️"
-            description += f"{prefix} {name} **{points} Point{'s' if points != 1 else ''}**\n"
+            prefix = medals[i] if i < 3 else ("🏅" if points >= 3 else "▪️")
+            unit   = "Point" if points == 1 else "Points"
+            # <@id> is the same text as member.mention, without looking the member up
+            rows.append(f"{prefix} <@{user_id}> **{points} {unit}**")
+        description = "\n".join(rows)
 
         embed = discord.Embed(
             title="Scrim - Leaderboard 🏆",
@@ -1161,19 +1760,27 @@ async def event(ctx, *, args):
             color=discord.Color.gold()
         )
 
-        # Delete the previous leaderboard embed before posting a fresh one
+        # Delete the previous leaderboard embed before posting a fresh one.
+        # Its ID is remembered in state.json, so this is a single DELETE without fetching history;
+        # the history scan is only a fallback for the first run without a stored ID.
+        last_id = bot_state.get("leaderboard_message_id")
         try:
-            async for old_msg in leaderboard_channel.history(limit=20):
-                if old_msg.author == bot.user:
-                    await old_msg.delete()
+            if last_id:
+                await with_backoff(leaderboard_channel.get_partial_message(last_id).delete)
+            else:
+                old_msgs = [m async for m in leaderboard_channel.history(limit=20) if m.author == bot.user]
+                await delete_messages_bulk(leaderboard_channel, old_msgs)
+        except discord.NotFound:
+            pass
         except Exception as e:
             await ctx.send(f"⚠️ Could not delete old leaderboard: `{e}`")
 
-        scrim_news_role = guild.get_role(MENTION_ROLES[1])
         mention_content = scrim_news_role.mention if scrim_news_role else ""
 
-        await leaderboard_channel.send(content=mention_content, embed=embed)
-        await ctx.send(f"✅ Leaderboard updated! Found **{games_found}** game(s) with winners.")
+        posted = await with_backoff(lambda: leaderboard_channel.send(content=mention_content, embed=embed))
+        bot_state["leaderboard_message_id"] = posted.id
+        dirty_files.add(STATE_FILE)
+        await ctx.send(f"✅ Leaderboard updated! Found **{games_found}** new game(s) with winners.")
 
     else:
         await ctx.send("❌ Unknown subcommand! Available: `r!event update`, `r!event leaderboard`")
@@ -1189,7 +1796,7 @@ async def event(ctx, *, args):
 @has_allowed_role()
 async def join(ctx):
     guild   = ctx.guild
-    channel = guild.get_channel(EVENT_CHANNEL_ID)
+    channel = event_channel
 
     if channel is None:
         await ctx.send("❌ Meeting Point channel not found!")
@@ -1287,19 +1894,17 @@ async def winner(ctx, user_id: str = None):
         return
 
     # Update stats
-    stats      = load_stats()
-    leaderboard = load_leaderboard()
-    uid_str    = str(user_id_int)
-    user_stats = get_or_create_stats(stats, uid_str)
+    stats       = stats_cache
+    leaderboard = leaderboard_cache
+    user_stats  = get_or_create_stats(stats, user_id_int)
 
     user_stats["games_won"]  += 1
     user_stats["win_streak"] += 1
     if user_stats["win_streak"] > user_stats["best_streak"]:
         user_stats["best_streak"] = user_stats["win_streak"]
-    leaderboard[uid_str] = leaderboard.get(uid_str, 0) + 1
+    leaderboard[user_id_int] = leaderboard.get(user_id_int, 0) + 1
 
-    save_stats(stats)
-    save_leaderboard(leaderboard)
+    dirty_files.update((STATS_FILE, LEADERBOARD_FILE))
 
     streak  = user_stats["win_streak"]
     best    = user_stats["best_streak"]
@@ -1331,34 +1936,36 @@ async def winner(ctx, user_id: str = None):
 @bot.command()
 async def stats(ctx, *, args=None):
     guild       = ctx.guild
-    stats       = load_stats()
-    leaderboard = load_leaderboard()
+    stats       = stats_cache
+    leaderboard = leaderboard_cache
 
     if args and args.strip().lower() == "top":
         if not stats:
             await ctx.send("❌ No stats available yet!")
             return
 
-        sorted_stats = []
-        for uid, s in stats.items():
-            rate = (s["attended"] / s["registered"] * 100) if s.get("registered", 0) > 0 else 0
-            sorted_stats.append((uid, s, rate))
-        sorted_stats.sort(key=lambda x: x[2], reverse=True)
+        # Only the top 10 are shown, so pick them with a heap instead of sorting every player
+        rated = (
+            (uid, s, (s["attended"] / s["registered"] * 100) if s.get("registered", 0) > 0 else 0)
+            for uid, s in stats.items()
+        )
+        top_stats = heapq.nlargest(10, rated, key=lambda x: x[2])
 
-        description = ""
-        for i, (uid, s, rate) in enumerate(sorted_stats[:10]):
-            member       = guild.get_member(int(uid))
+        rows = []
+        for i, (uid, s, rate) in enumerate(top_stats):
+            member       = guild.get_member(uid)
             name         = member.display_name if member else f"<@{uid}>"
             points       = leaderboard.get(uid, 0)
             games_played = s.get("games_played", 0)
             games_won    = s.get("games_won", 0)
             winrate      = (games_won / games_played * 100) if games_played > 0 else 0
-            description += (
+            rows.append(
                 f"**{i+1}.** {name} — "
                 f"{rate:.0f}% attendance ({s.get('attended',0)}/{s.get('registered',0)}) | "
                 f"{winrate:.0f}% WR ({games_won}W/{games_played - games_won}L) | "
-                f"{points} pts\n"
+                f"{points} pts"
             )
+        description = "\n".join(rows)
 
         embed = discord.Embed(
             title="🏅 Top 10 - Attendance Rate",
@@ -1374,9 +1981,8 @@ async def stats(ctx, *, args=None):
     else:
         target = ctx.author
 
-    uid_str    = str(target.id)
-    user_stats = stats.get(uid_str, {})
-    points     = leaderboard.get(uid_str, 0)
+    user_stats = stats.get(target.id, {})
+    points     = leaderboard.get(target.id, 0)
 
     registered   = user_stats.get("registered", 0)
     attended     = user_stats.get("attended", 0)
@@ -1427,57 +2033,51 @@ async def stats(ctx, *, args=None):
 @bot.event
 async def on_raw_reaction_add(payload):
     """Give the registration role when a user reacts ✅ to a tracked message."""
-    data        = load_data()
-    message_ids = get_all_message_ids(data)
-    if payload.message_id not in message_ids:
+    if payload.message_id not in event_by_message:
         return
-    if str(payload.emoji) != "✅":
+    if payload.emoji.name != CHECK_EMOJI:  # Attribute compare, no str() of the PartialEmoji
         return
-    guild  = bot.get_guild(payload.guild_id)
-    role   = guild.get_role(ROLE_ID)
-    member = guild.get_member(payload.user_id)
+    guild  = scrim_guild
+    role   = registration_role
+    # Guild reaction-add payloads carry the reacting member already; the cache is only a fallback
+    member = payload.member or guild.get_member(payload.user_id)
     if member and not member.bot:
-        await member.add_roles(role)
+        add_reactor(payload.message_id, member.id)
+        dirty_files.add(REACTIONS_FILE)
+        pending = pending_role_removals.pop(member.id, None)
+        if pending:
+            pending.cancel()  # They reacted again, so a pending role removal is obsolete
+        if member.get_role(ROLE_ID) is None:  # Skip the API call if they already have the role
+            role_queue.put_nowait((member, role, True))
 
 
 @bot.event
 async def on_raw_reaction_remove(payload):
     """Remove the registration role when a user un-reacts ✅, unless they reacted on another tracked message."""
-    data        = load_data()
-    message_ids = get_all_message_ids(data)
-    if payload.message_id not in message_ids:
+    if payload.message_id not in event_by_message:
         return
-    if str(payload.emoji) != "✅":
+    if payload.emoji.name != CHECK_EMOJI:  # Attribute compare, no str() of the PartialEmoji
         return
-    guild   = bot.get_guild(payload.guild_id)
-    role    = guild.get_role(ROLE_ID)
-    channel = bot.get_channel(CHANNEL_ID)
-    member  = guild.get_member(payload.user_id)
+    # Update the reaction cache even for uncached members; only the role handling needs the Member
+    # (bots are never in the reactor sets, so this is a no-op for them)
+    remove_reactor(payload.message_id, payload.user_id)
+    dirty_files.add(REACTIONS_FILE)
+
+    guild  = scrim_guild
+    role   = registration_role
+    member = guild.get_member(payload.user_id)
     if member is None or member.bot:
         return
 
-    # Check if the user still has ✅ on any other tracked message before removing the role
-    still_reacted = False
-    for msg_id in message_ids:
-        if msg_id == payload.message_id:
-            continue
-        try:
-            msg = await channel.fetch_message(msg_id)
-            for r in msg.reactions:
-                if str(r.emoji) == "✅":
-                    async for user in r.users():
-                        if user.id == member.id:
-                            still_reacted = True
-                            break
-                if still_reacted:
-                    break
-        except discord.NotFound:
-            pass
-        if still_reacted:
-            break
+    # Nothing to take away (a still-queued add re-checks the reaction cache before applying)
+    if member.get_role(ROLE_ID) is None:
+        return
 
-    if not still_reacted:
-        await member.remove_roles(role)
+    # Debounce: restart the user's pending check so rapid ✅ toggling resolves to one decision
+    pending = pending_role_removals.pop(member.id, None)
+    if pending:
+        pending.cancel()
+    pending_role_removals[member.id] = spawn(reconcile_registration_role(member, role))
 
 
 # ─── Message Delete Event ─────────────────────────────────────────────────────
@@ -1486,31 +2086,71 @@ async def on_raw_reaction_remove(payload):
 
 @bot.event
 async def on_raw_message_delete(payload):
-    data        = load_data()
-    message_ids = get_all_message_ids(data)
-    if payload.message_id not in message_ids:
+    if payload.message_id not in event_by_message:
         return
 
     print(f"Tracked message {payload.message_id} was deleted, resyncing roles...")
 
     # Remove the deleted message from storage
-    for event_id, msg_id in list(data.items()):
-        if msg_id == payload.message_id:
-            del data[event_id]
-            break
-    save_data(data)
-
-    channel               = bot.get_channel(CHANNEL_ID)
-    guild                 = channel.guild
-    role                  = guild.get_role(ROLE_ID)
-    remaining_message_ids = get_all_message_ids(data)
-    reacted_ids           = await get_all_reacted_ids(channel, remaining_message_ids)
+    untrack_messages([payload.message_id])
+
+    channel     = register_channel
+    guild       = scrim_guild
+    role        = registration_role
+    reacted_ids = await get_all_reacted_ids(channel, set(event_by_message))
     await sync_roles(guild, role, reacted_ids)
-    print(f"Roles resynced, now tracking {len(remaining_message_ids)} message(s)")
+    print(f"Roles resynced, now tracking {len(event_by_message)} message(s)")
+
+
+# ─── Registration Role Holders ────────────────────────────────────────────────
+# Keeps registration_holders (who has the registration role) current from the member events,
+# so sync_roles can diff against it instead of walking role.members.
+# Our own role edits come back through on_member_update as well.
+# on_member_update also invalidates the VC role snapshot when an Active/Spectator role is changed by hand.
+
+def seed_registration_holders():
+    """Rebuild registration_holders from the member cache (on connect, when the cache is fresh)."""
+    registration_holders.clear()
+    if registration_role:
+        registration_holders.update(m.id for m in registration_role.members)
+
+
+def scrim_roles_changed(before, after) -> bool:
+    """True if the member gained or lost the Active or Spectator Scrim role."""
+    return any(bool(before.get_role(rid)) != bool(after.get_role(rid)) for rid in (ACTIVE_ROLE_ID, SPECTATOR_ROLE_ID))
+
+
+@bot.event
+async def on_member_update(before, after):
+    global last_vc_snapshot
+    if after.guild != scrim_guild:
+        return
+    # A scrim role changed to a state the last VC pass didn't leave (manual edit or another bot): the next
+    # reconcile must not be skipped as "nobody moved", so it can put the role back where it belongs.
+    # Our own edits match the snapshot, so they keep it
+    if last_vc_snapshot is not None and scrim_roles_changed(before, after):
+        meeting_ids, game_ids = last_vc_snapshot
+        expected = (after.id in game_ids, after.id in meeting_ids)   # (Active, Spectator)
+        if (bool(after.get_role(ACTIVE_ROLE_ID)), bool(after.get_role(SPECTATOR_ROLE_ID))) != expected:
+            last_vc_snapshot = None
+    # Idempotent, so nickname/avatar updates just re-confirm the current state (get_role is a bisect)
+    if after.get_role(ROLE_ID):
+        registration_holders.add(after.id)
+    else:
+        registration_holders.discard(after.id)
+
+
+@bot.event
+async def on_member_remove(member):
+    registration_holders.discard(member.id)
 
 
 # ─── Run Bot ──────────────────────────────────────────────────────────────────
 # TOKEN is read from the environment variable to keep it out of the source code.
 # Set it with: export TOKEN=your_bot_token  (or via your hosting platform's secrets)
+# SIGTERM (sent by the host on shutdown/redeploy) is treated like Ctrl+C so bot.run() returns
+# normally and any state still waiting for the flush loop is written before exiting.
 
+signal.signal(signal.SIGTERM, signal.default_int_handler)
 bot.run(os.getenv("TOKEN"))
+flush_dirty_files()